@@ -7,6 +7,12 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from PIL import Image, ImageTk
 import time
 import threading
+from rag_cache import SafetyCache, compute_safe_sequence, compute_deadlock_cycle
+
+# Shared by both simulators; set RAG_CACHE_PATH to keep results across restarts.
+# Canonical keys are off so the GUI shows the same order and cycle as before.
+SAFETY_CACHE = SafetyCache(maxsize=256, canonicalize=False,
+                           path=os.environ.get("RAG_CACHE_PATH"))
 
 class RAGSimulator:
     def __init__(self, root):
@@ -300,43 +306,33 @@ class BankersAlgorithmGUI:
         self.update_graph_visualization("Updated with allocation and request edges")
     
     def bankers_algorithm(self):
+        rows = list(zip(self.allocation, self.max_need))
+        safe, order = SAFETY_CACHE.get("bankers", rows, (self.available,),
+                                        compute_safe_sequence)
         work = self.available[:]
-        finish = [False] * self.num_processes
-        safe_sequence = []
-        
-        need = [[self.max_need[i][j] - self.allocation[i][j] 
-                for j in range(self.num_resources)] 
-                for i in range(self.num_processes)]
-        
-        while len(safe_sequence) < self.num_processes:
-            found = False
-            for i in range(self.num_processes):
-                if not finish[i] and all(need[i][j] <= work[j] for j in range(self.num_resources)):
-                    # Add to safe sequence
-                    safe_sequence.append(f"P{i}")
-                    
-                    # Update animation to show this process can proceed
-                    self.highlight_process(i, "green")
-                    self.root.update()
-                    time.sleep(1)
-                    
-                    # Release resources
-                    for j in range(self.num_resources):
-                        work[j] += self.allocation[i][j]
-                    
-                    finish[i] = True
-                    found = True
-                    
-                    # Update visualization
-                    self.highlight_process(i, "lightblue")  # Reset color
-                    self.update_graph_visualization(f"Process P{i} completed - Work: {work}")
-                    time.sleep(1)
-                    break
-            
-            if not found:
-                return None  # Unsafe state
-        
-        return " → ".join(safe_sequence)
+        
+        # Replay the (possibly cached) order so the animation is unchanged
+        for process in order:
+            i = int(process[1:])
+            
+            # Update animation to show this process can proceed
+            self.highlight_process(i, "green")
+            self.root.update()
+            time.sleep(1)
+            
+            # Release resources
+            for j in range(self.num_resources):
+                work[j] += self.allocation[i][j]
+            
+            # Update visualization
+            self.highlight_process(i, "lightblue")  # Reset color
+            self.update_graph_visualization(f"Process P{i} completed - Work: {work}")
+            time.sleep(1)
+        
+        if not safe:
+            return None  # Unsafe state
+        
+        return " → ".join(order)
     
     def highlight_process(self, process_idx, color):
         node = f"P{process_idx}"
@@ -609,11 +605,12 @@ class CircularWaitGUI:
         self.update_graph_visualization("Updated with allocation and request edges")
     
     def detect_deadlock(self):
-        try:
-            cycle = nx.find_cycle(self.G)
-            return True, [(u, v) for u, v in cycle]
-        except nx.NetworkXNoCycle:
+        rows = list(zip(self.allocation, self.request))
+        has_deadlock, cycle = SAFETY_CACHE.get("deadlock", rows, (),
+                                               compute_deadlock_cycle)
+        if not has_deadlock:
             return False, None
+        return True, list(cycle)
     
     def highlight_cycle(self, cycle):
         # Highlight nodes and edges in the cycle
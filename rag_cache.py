@@ -0,0 +1,150 @@
+import os
+import threading
+import atexit
+import dbm
+import hashlib
+import shelve
+from collections import OrderedDict
+import networkx as nx
+
+class SafetyCache:
+    # Memoizes engine results keyed by the state arrays. Each process row is a
+    # tuple of that process's matrix rows; shared holds global vectors such as
+    # Available. With canonicalize=True rows are sorted first, so states that
+    # only differ by process numbering share one entry and results stored with
+    # canonical "P{k}" labels are mapped back to the caller's numbering. The
+    # mapped-back sequence or cycle is valid but may differ from the one found
+    # on the caller's own order.
+    #
+    # path adds an unbounded shelve tier; if it cannot be opened the cache
+    # stays memory-only. The shelve is not locked across processes, so do not
+    # point two running instances at the same path.
+    def __init__(self, maxsize=256, canonicalize=False, path=None):
+        self.maxsize = maxsize
+        self.canonicalize = canonicalize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.store = None
+        if path:
+            try:
+                self.store = shelve.open(os.path.expanduser(path))
+            except dbm.error:  # includes OSError
+                self.store = None
+            else:
+                atexit.register(self.close)
+
+    def get(self, engine, rows, shared, compute):
+        rows = tuple(tuple(tuple(r) for r in row) for row in rows)
+        shared = tuple(tuple(v) for v in shared)
+        if self.canonicalize:
+            order = sorted(range(len(rows)), key=rows.__getitem__)
+            rows = tuple(rows[i] for i in order)
+        else:
+            order = None
+        key = (engine, rows, shared)
+
+        with self.lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.relabel(result, order)
+
+            digest = None
+            if self.store is not None:
+                digest = self.digest(key)
+                result = self.store.get(digest)
+            if result is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                result = compute(rows, shared)
+                if digest is not None:
+                    self.store[digest] = result
+                    self.store.sync()
+
+            self.entries[key] = result
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return self.relabel(result, order)
+
+    def digest(self, key):
+        # Stable across restarts, unlike hash() which is salted for strings
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def relabel(self, value, order):
+        if order is None:
+            return value
+        if isinstance(value, str):
+            if value.startswith("P"):
+                return f"P{order[int(value[1:])]}"
+            return value
+        if isinstance(value, tuple):
+            return tuple(self.relabel(v, order) for v in value)
+        return value
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits,
+                    "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self.entries)}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            if self.store is not None:
+                self.store.clear()
+                self.store.sync()
+
+    def close(self):
+        with self.lock:
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+
+
+def compute_safe_sequence(rows, shared):
+    # rows[i] = (allocation[i], max_need[i]), shared = (available,)
+    allocation = [row[0] for row in rows]
+    need = [[m - a for a, m in zip(row[0], row[1])] for row in rows]
+    work = list(shared[0])
+    finish = [False] * len(rows)
+    order = []
+
+    while len(order) < len(rows):
+        found = False
+        for i in range(len(rows)):
+            if not finish[i] and all(n <= w for n, w in zip(need[i], work)):
+                order.append(f"P{i}")
+                for j, a in enumerate(allocation[i]):
+                    work[j] += a
+                finish[i] = True
+                found = True
+                break
+
+        if not found:
+            return False, tuple(order)
+
+    return True, tuple(order)
+
+def compute_deadlock_cycle(rows, shared):
+    # rows[i] = (allocation[i], request[i]); node and edge order match the GUI graph
+    G = nx.DiGraph()
+    num_resources = len(rows[0][0]) if rows else 0
+    G.add_nodes_from(f"P{i}" for i in range(len(rows)))
+    G.add_nodes_from(f"R{j}" for j in range(num_resources))
+    for i, (alloc_row, request_row) in enumerate(rows):
+        for j in range(num_resources):
+            if alloc_row[j] == 1:
+                G.add_edge(f"R{j}", f"P{i}")
+            if request_row[j] == 1:
+                G.add_edge(f"P{i}", f"R{j}")
+    try:
+        return True, tuple((u, v) for u, v in nx.find_cycle(G))
+    except nx.NetworkXNoCycle:
+        return False, ()
@@ -0,0 +1,113 @@
+from rag_cache import SafetyCache, compute_safe_sequence, compute_deadlock_cycle
+
+ALLOCATION = [[0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]]
+MAX_NEED = [[7, 5, 3], [3, 2, 2], [9, 0, 2], [2, 2, 2], [4, 3, 3]]
+AVAILABLE = [3, 3, 2]
+
+
+def is_safe_sequence(order, allocation, max_need, available):
+    work = list(available)
+    for process in order:
+        i = int(process[1:])
+        if any(m - a > w for a, m, w in zip(allocation[i], max_need[i], work)):
+            return False
+        work = [w + a for w, a in zip(work, allocation[i])]
+    return len(order) == len(allocation)
+
+
+def is_cycle(cycle, allocation, request):
+    for u, v in cycle:
+        if u.startswith("P"):
+            if request[int(u[1:])][int(v[1:])] != 1:
+                return False
+        elif allocation[int(v[1:])][int(u[1:])] != 1:
+            return False
+    return all(cycle[k][1] == cycle[(k + 1) % len(cycle)][0] for k in range(len(cycle)))
+
+
+def test_safe_sequence_keeps_caller_order():
+    rows = list(zip(ALLOCATION, MAX_NEED))
+    assert compute_safe_sequence(rows, (AVAILABLE,)) == (True, ("P1", "P3", "P0", "P2", "P4"))
+    assert compute_safe_sequence([([1, 0], [1, 0]), ([0, 0], [0, 0])], ([0, 0],)) == (True, ("P0", "P1"))
+
+
+def test_unsafe_state_reports_partial_order():
+    rows = [([0, 1], [2, 2]), ([1, 0], [1, 0])]
+    assert compute_safe_sequence(rows, ([0, 0],)) == (False, ("P1",))
+
+
+def test_cached_result_matches_uncached():
+    cache = SafetyCache()
+    rows = list(zip(ALLOCATION, MAX_NEED))
+    expected = compute_safe_sequence(rows, (AVAILABLE,))
+    assert cache.get("bankers", rows, (AVAILABLE,), compute_safe_sequence) == expected
+    assert cache.get("bankers", rows, (AVAILABLE,), compute_safe_sequence) == expected
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_permuted_input_maps_back_to_caller_labels():
+    cache = SafetyCache(canonicalize=True)
+    cache.get("bankers", list(zip(ALLOCATION, MAX_NEED)), (AVAILABLE,), compute_safe_sequence)
+
+    perm = [4, 3, 2, 1, 0]
+    allocation = [ALLOCATION[i] for i in perm]
+    max_need = [MAX_NEED[i] for i in perm]
+    safe, order = cache.get("bankers", list(zip(allocation, max_need)), (AVAILABLE,),
+                            compute_safe_sequence)
+    assert cache.stats()["hits"] == 1
+    assert safe
+    assert is_safe_sequence(order, allocation, max_need, AVAILABLE)
+
+
+def test_permuted_cycle_maps_back_to_caller_labels():
+    allocation = [[1, 0, 0], [0, 1, 0], [0, 0, 0]]
+    request = [[0, 1, 0], [1, 0, 0], [0, 0, 1]]
+    cache = SafetyCache(canonicalize=True)
+    cache.get("deadlock", list(zip(allocation, request)), (), compute_deadlock_cycle)
+
+    perm = [2, 0, 1]
+    allocation = [allocation[i] for i in perm]
+    request = [request[i] for i in perm]
+    has_deadlock, cycle = cache.get("deadlock", list(zip(allocation, request)), (),
+                                    compute_deadlock_cycle)
+    assert cache.stats()["hits"] == 1
+    assert has_deadlock
+    assert is_cycle(cycle, allocation, request)
+
+
+def test_no_cycle():
+    rows = [([1, 0], [0, 0]), ([0, 1], [1, 0])]
+    assert compute_deadlock_cycle(rows, ()) == (False, ())
+
+
+def test_lru_eviction():
+    cache = SafetyCache(maxsize=2)
+    for k in range(3):
+        cache.get("bankers", [([k], [k])], ([0],), compute_safe_sequence)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+    cache.get("bankers", [([0], [0])], ([0],), compute_safe_sequence)
+    assert cache.stats()["misses"] == 4
+
+
+def test_disk_tier_survives_close(tmp_path):
+    path = str(tmp_path / "cache")
+    rows = list(zip(ALLOCATION, MAX_NEED))
+    cache = SafetyCache(path=path)
+    expected = cache.get("bankers", rows, (AVAILABLE,), compute_safe_sequence)
+    cache.close()
+
+    cache = SafetyCache(path=path)
+    assert cache.get("bankers", rows, (AVAILABLE,), compute_safe_sequence) == expected
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["misses"] == 0
+    cache.close()
+
+
+def test_bad_path_falls_back_to_memory(tmp_path):
+    cache = SafetyCache(path=str(tmp_path / "missing" / "cache"))
+    assert cache.store is None
+    rows = [([1], [1])]
+    assert cache.get("bankers", rows, ([0],), compute_safe_sequence) == (True, ("P0",))